@@ -4,24 +4,29 @@ Provides advanced analytics and benchmark data
 """
 
 import numpy as np
-from datetime import datetime, timedelta
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from utils import njit
 
 # Constants for financial calculations
 COST_PER_EMPLOYEE = 5000  # Estimated monthly cost per employee
 OPERATIONAL_OVERHEAD = 1.2  # Operational overhead multiplier (20%)
 
+# Runway status buckets: <= 6, <= 12, <= 18 and > 18 months
+_RUNWAY_THRESH = np.array([6.0, 12.0, 18.0])
+_RUNWAY_STATUS = ('Critical', 'Concerning', 'Adequate', 'Healthy')
 
-def get_benchmark_data(prediction_label):
-    """
-    Get industry benchmark data based on prediction category
-    
-    Args:
-        prediction_label: The predicted success level
-    
-    Returns:
-        dict: Normalized benchmark values (0-100 scale)
-    """
-    benchmarks = {
+# Immutable insight entries, safe to share between memoized calls
+RiskFactor = namedtuple('RiskFactor', ['factor', 'severity', 'description'])
+Strength = namedtuple('Strength', ['factor', 'description'])
+InsightResult = namedtuple('InsightResult', ['status', 'message', 'score'])
+
+# Industry benchmarks per prediction category (0-100 scale)
+_BENCHMARKS = {
+    label: MappingProxyType(values)
+    for label, values in {
         "High Potential": {
             'funding': 80,
             'team_size': 75,
@@ -43,9 +48,116 @@ def get_benchmark_data(prediction_label):
             'revenue': 25,
             'growth_rate': 20
         }
-    }
+    }.items()
+}
+
+# Typical startup benchmarks (median values)
+_TYPICAL = MappingProxyType({
+    'funding': 250000,
+    'team_size': 8,
+    'market_size': 25000000,
+    'revenue': 15000,
+    'growth_rate': 10
+})
+_KEYS = tuple(_TYPICAL)
+_TYPICAL_ARR = np.array([_TYPICAL[k] for k in _KEYS], dtype=np.float64)
+
+# Benchmarks as struct-of-arrays: one read-only array per feature, indexed by
+# segment id (the position of the label in BENCHMARK_SEGMENTS, which matches
+# the model's class index)
+BENCHMARK_SEGMENTS = ("Low Potential", "Moderate Potential", "High Potential")
+BENCHMARKS = MappingProxyType({
+    key: np.array([_BENCHMARKS[label][key] for label in BENCHMARK_SEGMENTS], dtype=np.float64)
+    for key in _KEYS
+})
+for _values in BENCHMARKS.values():
+    _values.flags.writeable = False
+del _values
+_SEGMENT_IDS = {label: segment for segment, label in enumerate(BENCHMARK_SEGMENTS)}
+_THRESH = np.array([0.5, 0.8, 1.2, 2.0])
+_STATUS_LABELS = np.array([
+    'Well Below Average',
+    'Below Average',
+    'Average',
+    'Above Average',
+    'Well Above Average'
+])
+
+# Efficiency analyses computed by _score_all, in kernel output order
+_INSIGHT_KEYS = (
+    'funding_adequacy',
+    'team_efficiency',
+    'market_opportunity',
+    'revenue_health',
+    'growth_momentum'
+)
+
+# Shared result per bucket code, one table per entry in _INSIGHT_KEYS
+_FUNDING_RESULTS = (
+    InsightResult('Strong', 'Funding level is healthy relative to team size', 85),
+    InsightResult('Adequate', 'Funding is reasonable but could be improved', 60),
+    InsightResult('Concern', 'Funding may be stretched thin for team size', 35),
+)
+_TEAM_RESULTS = (
+    InsightResult('Excellent', 'High revenue per employee indicates strong efficiency', 90),
+    InsightResult('Good', 'Team efficiency is solid', 70),
+    InsightResult('Needs Improvement', 'Focus on improving revenue per team member', 40),
+)
+_MARKET_RESULTS = (
+    InsightResult('Huge Opportunity', 'Large untapped market potential', 95),
+    InsightResult('Good Opportunity', 'Significant room for market expansion', 75),
+    InsightResult('Limited', 'Consider expanding to new markets', 45),
+)
+_REVENUE_RESULTS = (
+    InsightResult('Strong', 'Revenue demonstrates strong product-market fit', 85),
+    InsightResult('Growing', 'Revenue shows promising early traction', 65),
+    InsightResult('Early Stage', 'Focus on achieving product-market fit', 35),
+)
+_GROWTH_RESULTS = (
+    InsightResult('Exceptional', 'Outstanding growth momentum', 95),
+    InsightResult('Strong', 'Solid growth trajectory', 75),
+    InsightResult('Moderate', 'Steady growth, room for acceleration', 55),
+    InsightResult('Slow', 'Growth needs significant improvement', 30),
+)
+_INSIGHT_RESULTS = (
+    _FUNDING_RESULTS,
+    _TEAM_RESULTS,
+    _MARKET_RESULTS,
+    _REVENUE_RESULTS,
+    _GROWTH_RESULTS
+)
+
+
+def get_benchmark_data(prediction_label):
+    """
+    Get industry benchmark data based on prediction category
+    
+    Args:
+        prediction_label: The predicted success level
+    
+    Returns:
+        mapping: Read-only normalized benchmark values (0-100 scale)
+    """
+    return _BENCHMARKS.get(prediction_label, _BENCHMARKS["Moderate Potential"])
+
+
+def get_benchmark_segment(prediction_label):
+    """
+    Get the benchmark segment id of a prediction category
+    
+    Args:
+        prediction_label: The predicted success level
+    
+    Returns:
+        int: Index into each BENCHMARKS array (unknown labels map to Moderate)
     
-    return benchmarks.get(prediction_label, benchmarks["Moderate Potential"])
+    Raises:
+        TypeError: if prediction_label is a bool rather than a label
+    """
+    # A bool would otherwise fall through to the Moderate segment, id 1
+    if isinstance(prediction_label, (bool, np.bool_)):
+        raise TypeError("prediction_label must be a prediction label, not a bool")
+    return _SEGMENT_IDS.get(prediction_label, _SEGMENT_IDS["Moderate Potential"])
 
 
 def calculate_feature_importance(model):
@@ -60,16 +172,16 @@ def calculate_feature_importance(model):
     """
     feature_names = ['Funding', 'Team Size', 'Market Size', 'Monthly Revenue', 'Growth Rate']
     
-    if hasattr(model, 'feature_importances_'):
+    try:
         importances = model.feature_importances_
-        # Convert to percentages
-        total = sum(importances)
-        importance_percentages = [(imp / total) * 100 for imp in importances]
-        
-        return dict(zip(feature_names, importance_percentages))
-    else:
+    except AttributeError:
         # Default equal importance if model doesn't support it
         return {name: 20.0 for name in feature_names}
+    
+    # Convert to percentages; tolist() keeps plain floats for JSON export
+    importance_percentages = importances * (100.0 / importances.sum())
+    
+    return dict(zip(feature_names, importance_percentages.tolist()))
 
 
 def generate_insights(features, prediction_label, success_score):
@@ -82,228 +194,256 @@ def generate_insights(features, prediction_label, success_score):
         success_score: float between 0-100
     
     Returns:
-        dict: Various insights and metrics
+        dict: Various insights and metrics; entries are immutable
+        namedtuples shared between calls with the same inputs
     """
+    return dict(_generate_insights_cached(
+        features['funding'],
+        features['team_size'],
+        features['market_size'],
+        features['revenue'],
+        features['growth_rate'],
+        success_score > 70
+    ))
+
+
+@lru_cache(maxsize=256)
+def _generate_insights_cached(funding, team_size, market_size, revenue, growth_rate, strong_score):
+    """All insights for one set of feature values, memoized"""
+    # Box the feature values into C doubles once for the kernel
+    f = np.fromiter(
+        (funding, team_size, market_size, revenue, growth_rate),
+        dtype=np.float64,
+        count=len(_KEYS)
+    )
+    codes = _score_all(f)
+    
     insights = {
-        'funding_adequacy': analyze_funding_adequacy(features),
-        'team_efficiency': analyze_team_efficiency(features),
-        'market_opportunity': analyze_market_opportunity(features),
-        'revenue_health': analyze_revenue_health(features),
-        'growth_momentum': analyze_growth_momentum(features),
-        'risk_factors': identify_risk_factors(features, prediction_label),
-        'strengths': identify_strengths(features, success_score)
+        key: results[code]
+        for key, results, code in zip(_INSIGHT_KEYS, _INSIGHT_RESULTS, codes.tolist())
     }
+    insights['risk_factors'] = _identify_risk_factors_cached(
+        funding, team_size, market_size, revenue, growth_rate
+    )
+    insights['strengths'] = _identify_strengths_cached(
+        funding, team_size, market_size, revenue, growth_rate, strong_score
+    )
     
     return insights
 
 
-def analyze_funding_adequacy(features):
-    """Analyze if funding is adequate for current scale"""
-    funding_per_employee = features['funding'] / max(features['team_size'], 1)
-    
+@njit('int8(float64, float64)', cache=True)
+def _funding_code(funding, team_size):
+    """Bucket funding per employee: 0 Strong, 1 Adequate, 2 Concern"""
+    funding_per_employee = funding / max(team_size, 1.0)
     if funding_per_employee > 100000:
-        return {
-            'status': 'Strong',
-            'message': 'Funding level is healthy relative to team size',
-            'score': 85
-        }
+        return 0
     elif funding_per_employee > 50000:
-        return {
-            'status': 'Adequate',
-            'message': 'Funding is reasonable but could be improved',
-            'score': 60
-        }
-    else:
-        return {
-            'status': 'Concern',
-            'message': 'Funding may be stretched thin for team size',
-            'score': 35
-        }
+        return 1
+    return 2
 
 
-def analyze_team_efficiency(features):
-    """Analyze team efficiency metrics"""
-    revenue_per_employee = features['revenue'] / max(features['team_size'], 1)
-    
+@njit('int8(float64, float64)', cache=True)
+def _team_code(revenue, team_size):
+    """Bucket revenue per employee: 0 Excellent, 1 Good, 2 Needs Improvement"""
+    revenue_per_employee = revenue / max(team_size, 1.0)
     if revenue_per_employee > 10000:
-        return {
-            'status': 'Excellent',
-            'message': 'High revenue per employee indicates strong efficiency',
-            'score': 90
-        }
+        return 0
     elif revenue_per_employee > 5000:
-        return {
-            'status': 'Good',
-            'message': 'Team efficiency is solid',
-            'score': 70
-        }
-    else:
-        return {
-            'status': 'Needs Improvement',
-            'message': 'Focus on improving revenue per team member',
-            'score': 40
-        }
+        return 1
+    return 2
 
 
-def analyze_market_opportunity(features):
-    """Analyze market size opportunity"""
-    revenue_market_ratio = (features['revenue'] * 12) / max(features['market_size'], 1)
-    
+@njit('int8(float64, float64)', cache=True)
+def _market_code(revenue, market_size):
+    """Bucket annual revenue share of market: 0 Huge, 1 Good, 2 Limited"""
+    revenue_market_ratio = (revenue * 12) / max(market_size, 1.0)
     if revenue_market_ratio < 0.001:
-        return {
-            'status': 'Huge Opportunity',
-            'message': 'Large untapped market potential',
-            'score': 95
-        }
+        return 0
     elif revenue_market_ratio < 0.01:
-        return {
-            'status': 'Good Opportunity',
-            'message': 'Significant room for market expansion',
-            'score': 75
-        }
-    else:
-        return {
-            'status': 'Limited',
-            'message': 'Consider expanding to new markets',
-            'score': 45
-        }
+        return 1
+    return 2
+
+
+@njit('int8(float64)', cache=True)
+def _revenue_code(revenue):
+    """Bucket monthly revenue: 0 Strong, 1 Growing, 2 Early Stage"""
+    if revenue > 100000:
+        return 0
+    elif revenue > 10000:
+        return 1
+    return 2
+
+
+@njit('int8(float64)', cache=True)
+def _growth_code(growth_rate):
+    """Bucket growth rate: 0 Exceptional, 1 Strong, 2 Moderate, 3 Slow"""
+    if growth_rate > 20:
+        return 0
+    elif growth_rate > 10:
+        return 1
+    elif growth_rate > 5:
+        return 2
+    return 3
+
+
+@njit('int8[::1](float64[::1])', cache=True)
+def _score_all(f):
+    """
+    Run all five efficiency analyses in a single compiled call
+    
+    Args:
+        f: float64 array of feature values ordered as _KEYS
+    
+    Returns:
+        np.ndarray: int8 bucket codes ordered as _INSIGHT_KEYS
+    """
+    codes = np.empty(5, dtype=np.int8)
+    
+    codes[0] = _funding_code(f[0], f[1])
+    codes[1] = _team_code(f[3], f[1])
+    codes[2] = _market_code(f[3], f[2])
+    codes[3] = _revenue_code(f[3])
+    codes[4] = _growth_code(f[4])
+    
+    return codes
+
+
+def analyze_funding_adequacy(features):
+    """Analyze if funding is adequate for current scale"""
+    return _FUNDING_RESULTS[_funding_code(features['funding'], features['team_size'])]
+
+
+def analyze_team_efficiency(features):
+    """Analyze team efficiency metrics"""
+    return _TEAM_RESULTS[_team_code(features['revenue'], features['team_size'])]
+
+
+def analyze_market_opportunity(features):
+    """Analyze market size opportunity"""
+    return _MARKET_RESULTS[_market_code(features['revenue'], features['market_size'])]
 
 
 def analyze_revenue_health(features):
     """Analyze revenue health indicators"""
-    if features['revenue'] > 100000:
-        return {
-            'status': 'Strong',
-            'message': 'Revenue demonstrates strong product-market fit',
-            'score': 85
-        }
-    elif features['revenue'] > 10000:
-        return {
-            'status': 'Growing',
-            'message': 'Revenue shows promising early traction',
-            'score': 65
-        }
-    else:
-        return {
-            'status': 'Early Stage',
-            'message': 'Focus on achieving product-market fit',
-            'score': 35
-        }
+    return _REVENUE_RESULTS[_revenue_code(features['revenue'])]
 
 
 def analyze_growth_momentum(features):
     """Analyze growth rate and momentum"""
-    growth_rate = features['growth_rate']
-    
-    if growth_rate > 20:
-        return {
-            'status': 'Exceptional',
-            'message': 'Outstanding growth momentum',
-            'score': 95
-        }
-    elif growth_rate > 10:
-        return {
-            'status': 'Strong',
-            'message': 'Solid growth trajectory',
-            'score': 75
-        }
-    elif growth_rate > 5:
-        return {
-            'status': 'Moderate',
-            'message': 'Steady growth, room for acceleration',
-            'score': 55
-        }
-    else:
-        return {
-            'status': 'Slow',
-            'message': 'Growth needs significant improvement',
-            'score': 30
-        }
+    return _GROWTH_RESULTS[_growth_code(features['growth_rate'])]
 
 
 def identify_risk_factors(features, prediction_label):
     """Identify key risk factors"""
-    risks = []
-    
-    if features['funding'] < 50000:
-        risks.append({
-            'factor': 'Underfunded',
-            'severity': 'High',
-            'description': 'Insufficient funding may limit growth'
-        })
-    
-    if features['team_size'] < 3:
-        risks.append({
-            'factor': 'Small Team',
-            'severity': 'Medium',
-            'description': 'Limited team may slow execution'
-        })
-    
-    if features['revenue'] < 5000:
-        risks.append({
-            'factor': 'Low Revenue',
-            'severity': 'High',
-            'description': 'Need to establish revenue stream'
-        })
-    
-    if features['growth_rate'] < 0:
-        risks.append({
-            'factor': 'Negative Growth',
-            'severity': 'Critical',
-            'description': 'Declining metrics require immediate action'
-        })
-    
-    if features['market_size'] < 5000000:
-        risks.append({
-            'factor': 'Small Market',
-            'severity': 'Medium',
-            'description': 'Limited market size may cap growth potential'
-        })
-    
-    return risks
+    return list(_identify_risk_factors_cached(
+        features['funding'],
+        features['team_size'],
+        features['market_size'],
+        features['revenue'],
+        features['growth_rate']
+    ))
+
+
+@lru_cache(maxsize=256)
+def _identify_risk_factors_cached(funding, team_size, market_size, revenue, growth_rate):
+    """Risk factors for one set of feature values, memoized as a tuple"""
+    return tuple(_iter_risk_factors(funding, team_size, market_size, revenue, growth_rate))
+
+
+def _iter_risk_factors(funding, team_size, market_size, revenue, growth_rate):
+    """Yield risk factors in display order"""
+    if funding < 50000:
+        yield RiskFactor(
+            factor='Underfunded',
+            severity='High',
+            description='Insufficient funding may limit growth'
+        )
+    
+    if team_size < 3:
+        yield RiskFactor(
+            factor='Small Team',
+            severity='Medium',
+            description='Limited team may slow execution'
+        )
+    
+    if revenue < 5000:
+        yield RiskFactor(
+            factor='Low Revenue',
+            severity='High',
+            description='Need to establish revenue stream'
+        )
+    
+    if growth_rate < 0:
+        yield RiskFactor(
+            factor='Negative Growth',
+            severity='Critical',
+            description='Declining metrics require immediate action'
+        )
+    
+    if market_size < 5000000:
+        yield RiskFactor(
+            factor='Small Market',
+            severity='Medium',
+            description='Limited market size may cap growth potential'
+        )
 
 
 def identify_strengths(features, success_score):
     """Identify key strengths"""
-    strengths = []
-    
-    if features['funding'] > 1000000:
-        strengths.append({
-            'factor': 'Well-Funded',
-            'description': 'Strong financial backing for growth'
-        })
-    
-    if features['team_size'] > 20:
-        strengths.append({
-            'factor': 'Strong Team',
-            'description': 'Substantial team to execute on vision'
-        })
-    
-    if features['revenue'] > 50000:
-        strengths.append({
-            'factor': 'Revenue Traction',
-            'description': 'Demonstrated ability to generate revenue'
-        })
-    
-    if features['growth_rate'] > 15:
-        strengths.append({
-            'factor': 'High Growth',
-            'description': 'Strong momentum and market validation'
-        })
-    
-    if features['market_size'] > 100000000:
-        strengths.append({
-            'factor': 'Large Market',
-            'description': 'Significant opportunity for expansion'
-        })
-    
-    if success_score > 70:
-        strengths.append({
-            'factor': 'Strong Overall Score',
-            'description': 'Well-balanced metrics across all dimensions'
-        })
-    
-    return strengths
+    return list(_identify_strengths_cached(
+        features['funding'],
+        features['team_size'],
+        features['market_size'],
+        features['revenue'],
+        features['growth_rate'],
+        success_score > 70
+    ))
+
+
+@lru_cache(maxsize=256)
+def _identify_strengths_cached(funding, team_size, market_size, revenue, growth_rate, strong_score):
+    """Strengths for one set of feature values, memoized as a tuple"""
+    return tuple(_iter_strengths(funding, team_size, market_size, revenue, growth_rate, strong_score))
+
+
+def _iter_strengths(funding, team_size, market_size, revenue, growth_rate, strong_score):
+    """Yield strengths in display order"""
+    if funding > 1000000:
+        yield Strength(
+            factor='Well-Funded',
+            description='Strong financial backing for growth'
+        )
+    
+    if team_size > 20:
+        yield Strength(
+            factor='Strong Team',
+            description='Substantial team to execute on vision'
+        )
+    
+    if revenue > 50000:
+        yield Strength(
+            factor='Revenue Traction',
+            description='Demonstrated ability to generate revenue'
+        )
+    
+    if growth_rate > 15:
+        yield Strength(
+            factor='High Growth',
+            description='Strong momentum and market validation'
+        )
+    
+    if market_size > 100000000:
+        yield Strength(
+            factor='Large Market',
+            description='Significant opportunity for expansion'
+        )
+    
+    if strong_score:
+        yield Strength(
+            factor='Strong Overall Score',
+            description='Well-balanced metrics across all dimensions'
+        )
 
 
 def calculate_runway_months(features):
@@ -328,16 +468,9 @@ def calculate_runway_months(features):
             'monthly_net': monthly_net
         }
     else:
-        runway = features['funding'] / abs(monthly_net) if monthly_net < 0 else float('inf')
-        
-        if runway > 18:
-            status = 'Healthy'
-        elif runway > 12:
-            status = 'Adequate'
-        elif runway > 6:
-            status = 'Concerning'
-        else:
-            status = 'Critical'
+        # monthly_net < 0 here, so negating it gives the positive monthly burn
+        runway = features['funding'] / -monthly_net
+        status = _RUNWAY_STATUS[int(np.searchsorted(_RUNWAY_THRESH, runway, side='left'))]
         
         return {
             'runway_months': round(runway, 1),
@@ -357,35 +490,18 @@ def generate_comparison_metrics(features):
     Returns:
         dict: Comparison metrics
     """
-    # Typical startup benchmarks (median values)
-    typical = {
-        'funding': 250000,
-        'team_size': 8,
-        'market_size': 25000000,
-        'revenue': 15000,
-        'growth_rate': 10
-    }
+    vals = np.fromiter((features[k] for k in _KEYS), dtype=np.float64, count=len(_KEYS))
+    ratios = vals / np.maximum(_TYPICAL_ARR, 1)
+    
+    # side='left' keeps the strict "ratio > threshold" boundaries
+    statuses = _STATUS_LABELS[np.searchsorted(_THRESH, ratios, side='left')]
     
     comparisons = {}
-    for key, value in features.items():
-        typical_value = typical.get(key, 1)
-        ratio = value / max(typical_value, 1)
-        
-        if ratio > 2:
-            status = 'Well Above Average'
-        elif ratio > 1.2:
-            status = 'Above Average'
-        elif ratio > 0.8:
-            status = 'Average'
-        elif ratio > 0.5:
-            status = 'Below Average'
-        else:
-            status = 'Well Below Average'
-        
+    for key, ratio, status in zip(_KEYS, np.round(ratios, 2).tolist(), statuses.tolist()):
         comparisons[key] = {
-            'ratio': round(ratio, 2),
+            'ratio': ratio,
             'status': status,
-            'typical_value': typical_value
+            'typical_value': _TYPICAL[key]
         }
     
     return comparisons
@@ -4,9 +4,10 @@ A modern web app for predicting startup success using machine learning
 """
 
 import streamlit as st
-import time
 from datetime import datetime
-from model import predict_startup_success, get_model
+from itertools import islice
+from pathlib import Path
+from model import predict_startup_success, load_model
 from utils import (
     validate_inputs, 
     get_strategy_suggestions, 
@@ -22,7 +23,7 @@ from visualizations import (
     create_success_trajectory_chart
 )
 from analytics import (
-    get_benchmark_data,
+    get_benchmark_segment,
     calculate_feature_importance,
     generate_insights,
     calculate_runway_months,
@@ -32,8 +33,7 @@ from data_export import (
     prepare_export_data,
     create_csv_export,
     create_json_export,
-    create_detailed_report_text,
-    format_csv_download
+    create_detailed_report_text
 )
 
 # Constants for visualization tabs
@@ -44,6 +44,32 @@ VIZ_TAB_LABELS = [
     "🔍 Comparison"
 ]
 
+# Custom stylesheet, read once at import
+STYLE_PATH = Path(__file__).parent / "assets" / "style.css"
+
+# Static page content, built once at import and re-emitted on every rerun;
+# Streamlit drops any element a rerun does not emit, so the CSS cannot be
+# injected only on the first run
+_CSS = f"<style>\n{STYLE_PATH.read_text(encoding='utf-8')}</style>"
+
+_SIDEBAR_ABOUT = """
+        This application uses a machine learning model to predict startup success based on key metrics:
+        
+        - **Funding Amount**: Total funding raised
+        - **Team Size**: Number of team members
+        - **Market Size**: Total addressable market
+        - **Monthly Revenue**: Current monthly revenue
+        - **Growth Rate**: Month-over-month growth
+        
+        The model classifies startups into three categories:
+        - 🟢 High Potential
+        - 🟡 Moderate Potential
+        - 🔴 Low Potential
+        """
+
+# Feature order used for hashable cache keys
+FEATURE_KEYS = ('funding', 'team_size', 'market_size', 'revenue', 'growth_rate')
+
 # Page configuration
 st.set_page_config(
     page_title="AI Startup Success Predictor",
@@ -53,46 +79,38 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-    <style>
-    .main {
-        padding: 2rem;
-    }
-    .stButton>button {
-        width: 100%;
-        background-color: #4CAF50;
-        color: white;
-        padding: 0.75rem;
-        font-size: 1.1rem;
-        border-radius: 10px;
-        border: none;
-        font-weight: bold;
-    }
-    .stButton>button:hover {
-        background-color: #45a049;
-    }
-    .success-box {
-        padding: 20px;
-        border-radius: 10px;
-        margin: 10px 0;
-    }
-    h1 {
-        color: #2c3e50;
-        text-align: center;
-        padding-bottom: 1rem;
-    }
-    h2 {
-        color: #34495e;
-        padding-top: 1rem;
-    }
-    .subtitle {
-        text-align: center;
-        color: #7f8c8d;
-        font-size: 1.2rem;
-        margin-bottom: 2rem;
+st.markdown(_CSS, unsafe_allow_html=True)
+
+
+def _show_chart(fig):
+    """Render a figure; builders return None when SP_FIGURES=0"""
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_resource
+def _load_model():
+    """Trained model shared across reruns and sessions"""
+    return load_model()
+
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def _cached_predict(funding, team_size, market_size, revenue, growth_rate):
+    """Cached prediction keyed on the five input values"""
+    features = {
+        'funding': funding,
+        'team_size': team_size,
+        'market_size': market_size,
+        'revenue': revenue,
+        'growth_rate': growth_rate
     }
-    </style>
-    """, unsafe_allow_html=True)
+    return predict_startup_success(features, model=_load_model())
+
+
+@st.cache_data(show_spinner=False)
+def _feature_importance_cached(model_id, _estimator):
+    """Feature importances, keyed on the id of the cached model"""
+    return calculate_feature_importance(_estimator)
 
 
 def main():
@@ -110,20 +128,7 @@ def main():
     # Sidebar with information
     with st.sidebar:
         st.header("📊 About This App")
-        st.write("""
-        This application uses a machine learning model to predict startup success based on key metrics:
-        
-        - **Funding Amount**: Total funding raised
-        - **Team Size**: Number of team members
-        - **Market Size**: Total addressable market
-        - **Monthly Revenue**: Current monthly revenue
-        - **Growth Rate**: Month-over-month growth
-        
-        The model classifies startups into three categories:
-        - 🟢 High Potential
-        - 🟡 Moderate Potential
-        - 🔴 Low Potential
-        """)
+        st.write(_SIDEBAR_ABOUT)
         
         st.markdown("---")
         st.info("💡 **Tip**: Realistic inputs lead to better predictions!")
@@ -131,59 +136,62 @@ def main():
     # Main input form
     st.header("📝 Enter Your Startup Details")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        funding = st.number_input(
-            "💰 Funding Amount ($)",
-            min_value=0,
-            max_value=10000000000,
-            value=500000,
-            step=10000,
-            help="Total funding raised by your startup"
-        )
+    with st.form("inputs_form"):
+        col1, col2 = st.columns(2)
         
-        team_size = st.number_input(
-            "👥 Team Size",
-            min_value=1,
-            max_value=10000,
-            value=10,
-            step=1,
-            help="Number of full-time team members"
-        )
+        with col1:
+            funding = st.number_input(
+                "💰 Funding Amount ($)",
+                min_value=0,
+                max_value=10000000000,
+                value=500000,
+                step=10000,
+                help="Total funding raised by your startup"
+            )
+            
+            team_size = st.number_input(
+                "👥 Team Size",
+                min_value=1,
+                max_value=10000,
+                value=10,
+                step=1,
+                help="Number of full-time team members"
+            )
+            
+            market_size = st.number_input(
+                "🎯 Market Size ($)",
+                min_value=0,
+                max_value=1000000000000,
+                value=50000000,
+                step=1000000,
+                help="Total addressable market size"
+            )
         
-        market_size = st.number_input(
-            "🎯 Market Size ($)",
-            min_value=0,
-            max_value=1000000000000,
-            value=50000000,
-            step=1000000,
-            help="Total addressable market size"
-        )
-    
-    with col2:
-        revenue = st.number_input(
-            "💵 Monthly Revenue ($)",
-            min_value=0,
-            max_value=1000000000,
-            value=25000,
-            step=1000,
-            help="Current monthly recurring revenue"
-        )
+        with col2:
+            revenue = st.number_input(
+                "💵 Monthly Revenue ($)",
+                min_value=0,
+                max_value=1000000000,
+                value=25000,
+                step=1000,
+                help="Current monthly recurring revenue"
+            )
+            
+            growth_rate = st.number_input(
+                "📈 Growth Rate (%)",
+                min_value=-100.0,
+                max_value=1000.0,
+                value=15.0,
+                step=0.5,
+                help="Month-over-month growth percentage"
+            )
         
-        growth_rate = st.number_input(
-            "📈 Growth Rate (%)",
-            min_value=-100.0,
-            max_value=1000.0,
-            value=15.0,
-            step=0.5,
-            help="Month-over-month growth percentage"
-        )
-    
-    st.markdown("---")
+        st.markdown("---")
+        
+        # Predict button
+        submitted = st.form_submit_button("🔮 Predict Success Potential", type="primary")
     
-    # Predict button
-    if st.button("🔮 Predict Success Potential", type="primary"):
+    if submitted:
         # Validate inputs
         is_valid, error_message = validate_inputs(
             funding, team_size, market_size, revenue, growth_rate
@@ -193,21 +201,6 @@ def main():
             st.error(f"❌ {error_message}")
             return
         
-        # Show progress bar
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        status_text.text("🔍 Analyzing your startup data...")
-        progress_bar.progress(25)
-        time.sleep(0.3)
-        
-        status_text.text("🤖 Running AI prediction model...")
-        progress_bar.progress(50)
-        time.sleep(0.3)
-        
-        status_text.text("📊 Calculating success metrics...")
-        progress_bar.progress(75)
-        
         # Prepare features
         features = {
             'funding': funding,
@@ -216,17 +209,14 @@ def main():
             'revenue': revenue,
             'growth_rate': growth_rate
         }
+        feature_values = tuple(features[k] for k in FEATURE_KEYS)
         
-        # Get prediction
-        result = predict_startup_success(features)
-        
-        progress_bar.progress(100)
-        status_text.text("✅ Analysis complete!")
-        time.sleep(0.5)
-        
-        # Clear progress indicators
-        progress_bar.empty()
-        status_text.empty()
+        with st.spinner("🤖 Running AI prediction..."):
+            # Get prediction
+            result = _cached_predict(*feature_values)
+            
+            # Generate insights
+            insights = generate_insights(features, result['prediction_label'], result['success_score'])
         
         # Display results
         st.markdown("---")
@@ -292,30 +282,18 @@ def main():
         viz_tab1, viz_tab2, viz_tab3, viz_tab4 = st.tabs(VIZ_TAB_LABELS)
         
         with viz_tab1:
-            st.plotly_chart(
-                create_probability_chart(result['probabilities']),
-                use_container_width=True
-            )
+            _show_chart(create_probability_chart(result['probabilities']))
         
         with viz_tab2:
-            st.plotly_chart(
-                create_success_gauge(result['success_score']),
-                use_container_width=True
-            )
+            _show_chart(create_success_gauge(result['success_score']))
         
         with viz_tab3:
-            st.plotly_chart(
-                create_success_trajectory_chart(result['success_score']),
-                use_container_width=True
-            )
+            _show_chart(create_success_trajectory_chart(result['success_score']))
             st.caption("📝 This projection shows potential growth scenarios based on your current success score")
         
         with viz_tab4:
-            benchmark_data = get_benchmark_data(result['prediction_label'])
-            st.plotly_chart(
-                create_feature_comparison_chart(features, benchmark_data),
-                use_container_width=True
-            )
+            benchmark_segment = get_benchmark_segment(result['prediction_label'])
+            _show_chart(create_feature_comparison_chart(features, benchmark_segment))
             st.caption("📝 Compare your metrics against industry benchmarks for your prediction category")
         
         st.markdown("---")
@@ -323,17 +301,14 @@ def main():
         # Advanced Analytics
         st.subheader("🔬 Advanced Analytics")
         
-        # Generate insights
-        insights = generate_insights(features, result['prediction_label'], result['success_score'])
-        
         # Display insights in columns
         insight_col1, insight_col2 = st.columns(2)
         
         with insight_col1:
             st.markdown("**💪 Key Strengths**")
             if insights['strengths']:
-                for strength in insights['strengths'][:3]:
-                    st.success(f"**{strength['factor']}**: {strength['description']}")
+                for strength in islice(insights['strengths'], 3):
+                    st.success(f"**{strength.factor}**: {strength.description}")
             else:
                 st.info("Focus on building fundamental strengths")
             
@@ -355,35 +330,32 @@ def main():
         with insight_col2:
             st.markdown("**⚠️ Risk Factors**")
             if insights['risk_factors']:
-                for risk in insights['risk_factors'][:3]:
+                for risk in islice(insights['risk_factors'], 3):
                     severity_emoji = {
                         'Critical': '🔴',
                         'High': '🟠',
                         'Medium': '🟡',
                         'Low': '🟢'
                     }
-                    emoji = severity_emoji.get(risk['severity'], '⚪')
-                    st.warning(f"{emoji} **{risk['factor']}**: {risk['description']}")
+                    emoji = severity_emoji.get(risk.severity, '⚪')
+                    st.warning(f"{emoji} **{risk.factor}**: {risk.description}")
             else:
                 st.success("No major risk factors identified!")
             
             st.markdown("**📊 Efficiency Metrics**")
-            st.info(f"**Funding Adequacy:** {insights['funding_adequacy']['status']} ({insights['funding_adequacy']['score']}/100)")
-            st.info(f"**Team Efficiency:** {insights['team_efficiency']['status']} ({insights['team_efficiency']['score']}/100)")
+            st.info(f"**Funding Adequacy:** {insights['funding_adequacy'].status} ({insights['funding_adequacy'].score}/100)")
+            st.info(f"**Team Efficiency:** {insights['team_efficiency'].status} ({insights['team_efficiency'].score}/100)")
         
         # Feature Importance
         st.markdown("---")
         st.subheader("🎯 Feature Impact Analysis")
         
-        model = get_model()
-        feature_importance = calculate_feature_importance(model.model)
+        model = _load_model()
+        feature_importance = _feature_importance_cached(id(model), model.model)
         
         col_a, col_b = st.columns([2, 1])
         with col_a:
-            st.plotly_chart(
-                create_feature_impact_chart(feature_importance),
-                use_container_width=True
-            )
+            _show_chart(create_feature_impact_chart(feature_importance))
         with col_b:
             st.markdown("**What This Shows:**")
             st.write("This chart displays which features have the most impact on the prediction model's decisions.")
@@ -442,39 +414,38 @@ def main():
         st.markdown("---")
         st.subheader("📥 Export Analysis")
         
+        # Payloads are only built when their button is clicked; they are
+        # stamped with the render time so they match the file names
+        generated_at = datetime.now()
+        ts = generated_at.strftime('%Y%m%d_%H%M%S')
         export_col1, export_col2, export_col3 = st.columns(3)
         
         with export_col1:
             # CSV Export
-            csv_data = create_csv_export(features, result)
-            csv_string = format_csv_download(csv_data)
             st.download_button(
                 label="📊 Download CSV",
-                data=csv_string,
-                file_name=f"startup_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                data=lambda: create_csv_export(features, result, generated_at),
+                file_name=f"startup_analysis_{ts}.csv",
                 mime="text/csv",
                 help="Download results as CSV file"
             )
         
         with export_col2:
             # JSON Export
-            export_data = prepare_export_data(features, result, insights)
-            json_string = create_json_export(export_data)
             st.download_button(
                 label="📋 Download JSON",
-                data=json_string,
-                file_name=f"startup_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                data=lambda: create_json_export(prepare_export_data(features, result, insights, generated_at)),
+                file_name=f"startup_analysis_{ts}.json",
                 mime="application/json",
                 help="Download results as JSON file"
             )
         
         with export_col3:
             # Text Report Export
-            report_text = create_detailed_report_text(features, result, insights)
             st.download_button(
                 label="📄 Download Report",
-                data=report_text,
-                file_name=f"startup_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                data=lambda: create_detailed_report_text(features, result, insights, generated_at),
+                file_name=f"startup_report_{ts}.txt",
                 mime="text/plain",
                 help="Download detailed text report"
             )
@@ -3,12 +3,34 @@ Data Export Module for Startup Success Predictor
 Provides functionality to export results and analysis
 """
 
-import pandas as pd
+import csv
+import io
 from datetime import datetime
 import json
 
+# Column headers for the CSV export
+CSV_HEADER = (
+    'Timestamp',
+    'Funding ($)',
+    'Team Size',
+    'Market Size ($)',
+    'Monthly Revenue ($)',
+    'Growth Rate (%)',
+    'Success Score',
+    'Prediction',
+    'Confidence (%)',
+    'Low Potential (%)',
+    'Moderate Potential (%)',
+    'High Potential (%)'
+)
 
-def prepare_export_data(features, result, insights=None):
+# Separators and closing block of the text report
+_BANNER = "=" * 60
+_RULE = "-" * 60
+_FOOTER = f"\n{_BANNER}\nEND OF REPORT\n{_BANNER}"
+
+
+def prepare_export_data(features, result, insights=None, generated_at=None):
     """
     Prepare data for export in various formats
     
@@ -16,12 +38,13 @@ def prepare_export_data(features, result, insights=None):
         features: dict with startup features
         result: dict with prediction results
         insights: optional dict with analytics insights
+        generated_at: optional datetime to stamp the export with; defaults to now
     
     Returns:
         dict: Formatted data ready for export
     """
     export_data = {
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'timestamp': _timestamp(generated_at),
         'input_metrics': {
             'funding': features['funding'],
             'team_size': features['team_size'],
@@ -38,38 +61,58 @@ def prepare_export_data(features, result, insights=None):
     }
     
     if insights:
-        export_data['insights'] = insights
+        export_data['insights'] = _to_plain(insights)
     
     return export_data
 
 
-def create_csv_export(features, result):
+def _timestamp(generated_at):
+    """Format the export timestamp, using the current time if none is given"""
+    return (generated_at or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _to_plain(value):
+    """Convert namedtuple insight entries into JSON-friendly dicts and lists"""
+    if hasattr(value, '_asdict'):
+        return {k: _to_plain(v) for k, v in value._asdict().items()}
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    return value
+
+
+def create_csv_export(features, result, generated_at=None):
     """
     Create CSV export data
     
     Args:
         features: dict with startup features
         result: dict with prediction results
+        generated_at: optional datetime to stamp the export with; defaults to now
     
     Returns:
-        pandas DataFrame
+        str: CSV formatted string with a header row and one data row
     """
-    data = {
-        'Timestamp': [datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-        'Funding ($)': [features['funding']],
-        'Team Size': [features['team_size']],
-        'Market Size ($)': [features['market_size']],
-        'Monthly Revenue ($)': [features['revenue']],
-        'Growth Rate (%)': [features['growth_rate']],
-        'Success Score': [result['success_score']],
-        'Prediction': [result['prediction_label']],
-        'Confidence (%)': [result['confidence']],
-        'Low Potential (%)': [result['probabilities']['low']],
-        'Moderate Potential (%)': [result['probabilities']['moderate']],
-        'High Potential (%)': [result['probabilities']['high']]
-    }
-    
-    return pd.DataFrame(data)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(CSV_HEADER)
+    writer.writerow([
+        _timestamp(generated_at),
+        features['funding'],
+        features['team_size'],
+        features['market_size'],
+        features['revenue'],
+        features['growth_rate'],
+        result['success_score'],
+        result['prediction_label'],
+        result['confidence'],
+        result['probabilities']['low'],
+        result['probabilities']['moderate'],
+        result['probabilities']['high']
+    ])
+    
+    return buffer.getvalue()
 
 
 def create_json_export(export_data):
@@ -85,7 +128,7 @@ def create_json_export(export_data):
     return json.dumps(export_data, indent=2)
 
 
-def create_detailed_report_text(features, result, insights=None):
+def create_detailed_report_text(features, result, insights=None, generated_at=None):
     """
     Create a detailed text report
     
@@ -93,81 +136,71 @@ def create_detailed_report_text(features, result, insights=None):
         features: dict with startup features
         result: dict with prediction results
         insights: optional dict with analytics insights
+        generated_at: optional datetime to stamp the report with; defaults to now
     
     Returns:
         str: Formatted text report
     """
-    report = []
-    report.append("=" * 60)
-    report.append("AI STARTUP SUCCESS PREDICTOR - ANALYSIS REPORT")
-    report.append("=" * 60)
-    report.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    
-    report.append("\n" + "-" * 60)
-    report.append("INPUT METRICS")
-    report.append("-" * 60)
-    report.append(f"Funding Amount:        ${features['funding']:,.2f}")
-    report.append(f"Team Size:             {features['team_size']} members")
-    report.append(f"Market Size:           ${features['market_size']:,.2f}")
-    report.append(f"Monthly Revenue:       ${features['revenue']:,.2f}")
-    report.append(f"Growth Rate:           {features['growth_rate']}%")
-    
-    report.append("\n" + "-" * 60)
-    report.append("PREDICTION RESULTS")
-    report.append("-" * 60)
-    report.append(f"Success Score:         {result['success_score']}/100")
-    report.append(f"Prediction:            {result['prediction_label']}")
-    report.append(f"Confidence:            {result['confidence']}%")
+    probabilities = result['probabilities']
+    header = f"""{_BANNER}
+AI STARTUP SUCCESS PREDICTOR - ANALYSIS REPORT
+{_BANNER}
+
+Generated: {_timestamp(generated_at)}
+
+
+{_RULE}
+INPUT METRICS
+{_RULE}
+Funding Amount:        ${features['funding']:,.2f}
+Team Size:             {features['team_size']} members
+Market Size:           ${features['market_size']:,.2f}
+Monthly Revenue:       ${features['revenue']:,.2f}
+Growth Rate:           {features['growth_rate']}%
+
+{_RULE}
+PREDICTION RESULTS
+{_RULE}
+Success Score:         {result['success_score']}/100
+Prediction:            {result['prediction_label']}
+Confidence:            {result['confidence']}%
+
+{_RULE}
+PROBABILITY BREAKDOWN
+{_RULE}
+Low Potential:         {probabilities['low']}%
+Moderate Potential:    {probabilities['moderate']}%
+High Potential:        {probabilities['high']}%"""
     
-    report.append("\n" + "-" * 60)
-    report.append("PROBABILITY BREAKDOWN")
-    report.append("-" * 60)
-    report.append(f"Low Potential:         {result['probabilities']['low']}%")
-    report.append(f"Moderate Potential:    {result['probabilities']['moderate']}%")
-    report.append(f"High Potential:        {result['probabilities']['high']}%")
+    # Only the insights section varies in shape
+    report = [header]
     
     if insights:
-        report.append("\n" + "-" * 60)
-        report.append("DETAILED INSIGHTS")
-        report.append("-" * 60)
+        report.append(f"\n{_RULE}\nDETAILED INSIGHTS\n{_RULE}")
         
         if 'strengths' in insights and insights['strengths']:
             report.append("\nSTRENGTHS:")
             for strength in insights['strengths']:
-                report.append(f"  • {strength['factor']}: {strength['description']}")
+                report.append(f"  • {strength.factor}: {strength.description}")
         
         if 'risk_factors' in insights and insights['risk_factors']:
             report.append("\nRISK FACTORS:")
             for risk in insights['risk_factors']:
-                report.append(f"  • {risk['factor']} ({risk['severity']}): {risk['description']}")
+                report.append(f"  • {risk.factor} ({risk.severity}): {risk.description}")
         
         if 'funding_adequacy' in insights:
-            report.append(f"\nFunding Adequacy:      {insights['funding_adequacy']['status']}")
-            report.append(f"  {insights['funding_adequacy']['message']}")
+            report.append(f"\nFunding Adequacy:      {insights['funding_adequacy'].status}")
+            report.append(f"  {insights['funding_adequacy'].message}")
         
         if 'team_efficiency' in insights:
-            report.append(f"\nTeam Efficiency:       {insights['team_efficiency']['status']}")
-            report.append(f"  {insights['team_efficiency']['message']}")
+            report.append(f"\nTeam Efficiency:       {insights['team_efficiency'].status}")
+            report.append(f"  {insights['team_efficiency'].message}")
         
         if 'growth_momentum' in insights:
-            report.append(f"\nGrowth Momentum:       {insights['growth_momentum']['status']}")
-            report.append(f"  {insights['growth_momentum']['message']}")
+            report.append(f"\nGrowth Momentum:       {insights['growth_momentum'].status}")
+            report.append(f"  {insights['growth_momentum'].message}")
     
-    report.append("\n" + "=" * 60)
-    report.append("END OF REPORT")
-    report.append("=" * 60)
+    report.append(_FOOTER)
     
     return "\n".join(report)
 
-
-def format_csv_download(df):
-    """
-    Format DataFrame for CSV download
-    
-    Args:
-        df: pandas DataFrame
-    
-    Returns:
-        str: CSV formatted string
-    """
-    return df.to_csv(index=False)
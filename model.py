@@ -3,18 +3,83 @@ Machine Learning Model for Startup Success Prediction
 This module trains a RandomForest classifier and provides prediction functionality.
 """
 
+import math
+import os
+
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
+
+from utils import njit
+
+# Feature order shared by the models
+_FEATURE_KEYS = ('funding', 'team_size', 'market_size', 'revenue', 'growth_rate')
+
+# Class index to prediction label
+_LABELS = {0: "Low Potential", 1: "Moderate Potential", 2: "High Potential"}
+
+# Per-class contribution to the 0-100 success score
+_SCORE_WEIGHTS = np.array([0.0, 50.0, 100.0])
+
+# Bump whenever the training data or model settings change
+MODEL_VERSION = 1
+
+# Trained StartupSuccessModel persisted between cold starts
+MODEL_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "model_cache.joblib")
+
+# Uniform sampling bounds per class for the synthetic training data;
+# rows are High (2), Moderate (1) and Low (0), columns follow _FEATURE_KEYS
+_TRAINING_LOWS = np.array([
+    [1000000, 20, 50000000, 100000, 15],
+    [100000, 5, 10000000, 10000, 5],
+    [10000, 1, 1000000, 0, -5]
+], dtype=np.float64)
+_TRAINING_HIGHS = np.array([
+    [10000000, 100, 500000000, 1000000, 50],
+    [1000000, 20, 50000000, 100000, 15],
+    [100000, 5, 10000000, 10000, 5]
+], dtype=np.float64)
+_TRAINING_LABELS = np.array([2, 1, 0])
+
+# Features that span orders of magnitude and are compared on a log10 scale
+_LOG_SCALE = (True, False, True, True, False)
+
+# Per-feature (low|moderate boundary, moderate|high boundary, log scale);
+# the class ranges are disjoint, so the boundaries are the Moderate and
+# High lows of the training data
+_CLASS_BOUNDARIES = tuple(zip(_TRAINING_LOWS[1].tolist(), _TRAINING_LOWS[0].tolist(), _LOG_SCALE))
+
+# Sharpness of the softmax over class distances in ClosedFormStartupModel
+_SOFTMAX_SHARPNESS = 4.0
+
+
+@njit(cache=True)
+def _scale(x, mean, inv_scale):
+    """Standardize rows of x like StandardScaler.transform"""
+    return (x - mean) * inv_scale
+
+
+def _warm_up():
+    """Compile the jitted helpers before the first prediction"""
+    n_features = len(_FEATURE_KEYS)
+    _scale(
+        np.zeros((1, n_features), dtype=np.float32),
+        np.zeros(n_features, dtype=np.float32),
+        np.ones(n_features, dtype=np.float32)
+    )
 
 
 class StartupSuccessModel:
     """RandomForest model for predicting startup success"""
     
     def __init__(self):
+        # Imported here so the closed-form path never loads scikit-learn
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.preprocessing import StandardScaler
+        
+        # 40 shallow trees are plenty for three well-separated classes
         self.model = RandomForestClassifier(
-            n_estimators=100,
-            max_depth=10,
+            n_estimators=40,
+            max_depth=8,
+            n_jobs=-1,
             random_state=42
         )
         self.scaler = StandardScaler()
@@ -26,45 +91,23 @@ class StartupSuccessModel:
         Features: [Funding, Team Size, Market Size, Monthly Revenue, Growth Rate]
         Labels: 0 (Low), 1 (Moderate), 2 (High)
         """
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
-        # Generate 1000 synthetic training samples
+        # Generate 1000 synthetic training samples (333 per class)
         n_samples = 1000
+        n_per_class = n_samples // 3
         
-        # High Success Startups (label 2)
-        high_funding = np.random.uniform(1000000, 10000000, n_samples // 3)
-        high_team = np.random.uniform(20, 100, n_samples // 3)
-        high_market = np.random.uniform(50000000, 500000000, n_samples // 3)
-        high_revenue = np.random.uniform(100000, 1000000, n_samples // 3)
-        high_growth = np.random.uniform(15, 50, n_samples // 3)
-        high_samples = np.column_stack([high_funding, high_team, high_market, high_revenue, high_growth])
-        high_labels = np.full(n_samples // 3, 2)
-        
-        # Moderate Success Startups (label 1)
-        mod_funding = np.random.uniform(100000, 1000000, n_samples // 3)
-        mod_team = np.random.uniform(5, 20, n_samples // 3)
-        mod_market = np.random.uniform(10000000, 50000000, n_samples // 3)
-        mod_revenue = np.random.uniform(10000, 100000, n_samples // 3)
-        mod_growth = np.random.uniform(5, 15, n_samples // 3)
-        mod_samples = np.column_stack([mod_funding, mod_team, mod_market, mod_revenue, mod_growth])
-        mod_labels = np.full(n_samples // 3, 1)
-        
-        # Low Success Startups (label 0)
-        low_funding = np.random.uniform(10000, 100000, n_samples // 3)
-        low_team = np.random.uniform(1, 5, n_samples // 3)
-        low_market = np.random.uniform(1000000, 10000000, n_samples // 3)
-        low_revenue = np.random.uniform(0, 10000, n_samples // 3)
-        low_growth = np.random.uniform(-5, 5, n_samples // 3)
-        low_samples = np.column_stack([low_funding, low_team, low_market, low_revenue, low_growth])
-        low_labels = np.full(n_samples // 3, 0)
-        
-        # Combine all samples
-        X = np.vstack([high_samples, mod_samples, low_samples])
-        y = np.concatenate([high_labels, mod_labels, low_labels])
-        
-        # Shuffle the data
-        indices = np.random.permutation(len(X))
-        X = X[indices]
+        # Broadcast the per-class bounds to one row per sample and draw
+        # every feature of every sample in a single call
+        lows = np.repeat(_TRAINING_LOWS, n_per_class, axis=0)
+        highs = np.repeat(_TRAINING_HIGHS, n_per_class, axis=0)
+        X = rng.uniform(lows, highs)
+        y = np.repeat(_TRAINING_LABELS, n_per_class)
+        
+        # Shuffle the data; the trees split on float32 internally, so cast
+        # once here instead of inside every fit and transform
+        indices = rng.permutation(len(X))
+        X = X[indices].astype(np.float32, copy=False)
         y = y[indices]
         
         return X, y
@@ -76,12 +119,21 @@ class StartupSuccessModel:
         # Standardize features
         X_scaled = self.scaler.fit_transform(X)
         
-        # Train the model
+        # Train the model across all cores, then predict single rows
+        # serially where thread dispatch would cost more than the trees
         self.model.fit(X_scaled, y)
-        self.is_trained = True
+        self.model.set_params(n_jobs=1)
         
+        self._freeze_scaling()
         return self
     
+    def _freeze_scaling(self):
+        """Freeze the fitted scaler into arrays for predict()"""
+        # Lets predict() skip StandardScaler.transform and its input validation
+        self._mean = self.scaler.mean_.astype(np.float32)
+        self._inv_scale = (1.0 / self.scaler.scale_).astype(np.float32)
+        self.is_trained = True
+    
     def predict(self, features):
         """
         Predict startup success
@@ -102,61 +154,171 @@ class StartupSuccessModel:
             features['market_size'],
             features['revenue'],
             features['growth_rate']
-        ]])
+        ]], dtype=np.float32)
         
-        # Scale features
-        X_scaled = self.scaler.transform(X)
+        # Scale features with the precomputed statistics
+        X_scaled = _scale(X, self._mean, self._inv_scale)
         
         # Get prediction and probabilities
         prediction = self.model.predict(X_scaled)[0]
         probabilities = self.model.predict_proba(X_scaled)[0]
         
         # Convert prediction to label
-        labels = {0: "Low Potential", 1: "Moderate Potential", 2: "High Potential"}
-        prediction_label = labels[prediction]
+        prediction_label = _LABELS[prediction]
         
         # Calculate success score (0-100)
         # Weighted average of probabilities
-        success_score = (probabilities[0] * 0 + probabilities[1] * 50 + probabilities[2] * 100)
+        success_score = float(probabilities @ _SCORE_WEIGHTS)
         
         # Confidence is the max probability
-        confidence = max(probabilities) * 100
+        confidence = float(probabilities.max()) * 100
+        
+        return success_score, prediction_label, confidence, probabilities
+
+
+def _model_fingerprint():
+    """Identify the code and library versions a persisted model came from"""
+    import sklearn
+    
+    return MODEL_VERSION, sklearn.__version__, os.path.getmtime(__file__)
+
+
+def load_model(path=MODEL_CACHE_PATH):
+    """
+    Load the persisted model, training and persisting a new one if the file
+    is missing, unreadable or was written by a different version of model.py
+    
+    Args:
+        path: joblib file holding the trained model and scaler
+    
+    Returns:
+        StartupSuccessModel: trained model
+    """
+    import joblib
+    
+    _warm_up()
+    fingerprint = _model_fingerprint()
+    
+    # A missing, truncated or incompatible file just means retraining
+    try:
+        state = joblib.load(path)
+        if state['version'] == fingerprint:
+            model = StartupSuccessModel()
+            model.model = state['model']
+            model.scaler = state['scaler']
+            model._freeze_scaling()
+            return model
+    except Exception:
+        pass
+    
+    model = StartupSuccessModel().train()
+    
+    # Write to a temporary file first so concurrent workers never load a
+    # partial dump; read-only deployments simply retrain on each cold start
+    state = {'version': fingerprint, 'model': model.model, 'scaler': model.scaler}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        joblib.dump(state, tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return model
+
+
+class ClosedFormStartupModel:
+    """
+    Training-free scorer with the same predict() interface
+    
+    The synthetic classes occupy disjoint ranges on every feature, so each
+    feature is placed on a 0-2 scale between the class boundaries (0.5 and
+    1.5 sit on the boundaries), the positions are averaged, and the class is
+    read off with two thresholds. Probabilities are a softmax over the
+    negative squared distance to each class centre. Needs no sklearn.
+    """
+    
+    is_trained = True
+    
+    def train(self):
+        """Nothing to fit; kept for interface compatibility"""
+        return self
+    
+    def predict(self, features):
+        """
+        Predict startup success
+        
+        Args:
+            features: dict with keys ['funding', 'team_size', 'market_size', 'revenue', 'growth_rate']
+        
+        Returns:
+            tuple: (success_score, prediction_label, confidence, probabilities)
+        """
+        position = 0.0
+        for key, (lower, upper, log_scale) in zip(_FEATURE_KEYS, _CLASS_BOUNDARIES):
+            value = features[key]
+            if log_scale:
+                value = math.log10(max(value, 1.0))
+                lower, upper = math.log10(lower), math.log10(upper)
+            position += min(max(0.5 + (value - lower) / (upper - lower), 0.0), 2.0)
+        position /= len(_CLASS_BOUNDARIES)
+        
+        if position < 0.5:
+            prediction = 0
+        elif position < 1.5:
+            prediction = 1
+        else:
+            prediction = 2
+        
+        logits = [-_SOFTMAX_SHARPNESS * (position - centre) ** 2 for centre in range(3)]
+        peak = max(logits)
+        weights = [math.exp(logit - peak) for logit in logits]
+        total = sum(weights)
+        probabilities = np.array([weight / total for weight in weights])
+        
+        prediction_label = _LABELS[prediction]
+        
+        success_score = float(probabilities @ _SCORE_WEIGHTS)
+        confidence = float(probabilities.max()) * 100
         
         return success_score, prediction_label, confidence, probabilities
 
 
-# Global model instance
+# Global model instance for callers outside Streamlit
 _model_instance = None
 
 def get_model():
     """Get or create the global model instance"""
     global _model_instance
     if _model_instance is None:
-        _model_instance = StartupSuccessModel()
-        _model_instance.train()
+        _model_instance = load_model()
     return _model_instance
 
 
-def predict_startup_success(data):
+def predict_startup_success(data, model=None):
     """
     Main prediction function
     
     Args:
         data: dict with startup features
+        model: optional trained StartupSuccessModel or ClosedFormStartupModel;
+            defaults to get_model()
     
     Returns:
         dict with prediction results
     """
-    model = get_model()
+    if model is None:
+        model = get_model()
     success_score, prediction_label, confidence, probabilities = model.predict(data)
+    pct = np.round(probabilities * 100, 2).tolist()
     
     return {
         'success_score': round(success_score, 2),
         'prediction_label': prediction_label,
         'confidence': round(confidence, 2),
         'probabilities': {
-            'low': round(probabilities[0] * 100, 2),
-            'moderate': round(probabilities[1] * 100, 2),
-            'high': round(probabilities[2] * 100, 2)
+            'low': pct[0],
+            'moderate': pct[1],
+            'high': pct[2]
         }
     }
@@ -3,6 +3,65 @@ Utility functions for the Startup Success Predictor
 Includes input validation and helper functions
 """
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Color code per prediction label
+_SUCCESS_COLORS = {
+    "High Potential": "#28a745",  # Green
+    "Moderate Potential": "#ffc107",  # Yellow
+    "Low Potential": "#dc3545"  # Red
+}
+
+# (scale, suffix) pairs for format_currency, largest first
+_CURRENCY_SCALES = ((1e9, "B"), (1e6, "M"), (1e3, "K"))
+
+# (check, message) rules applied to the features by get_strategy_suggestions
+_SUGGESTION_RULES = (
+    # Check funding level
+    (lambda f: f['funding'] < 100000,
+     "💰 Consider seeking additional funding to scale operations"),
+    # Check team size
+    (lambda f: f['team_size'] < 5,
+     "👥 Growing your team could help accelerate development"),
+    (lambda f: f['team_size'] > 50 and f['revenue'] < 50000,
+     "⚖️ Team size seems large relative to revenue - optimize costs"),
+    # Check market size
+    (lambda f: f['market_size'] < 10000000,
+     "🎯 Consider expanding to larger markets for better growth potential"),
+    # Check revenue
+    (lambda f: f['revenue'] < 10000,
+     "💵 Focus on revenue generation and finding product-market fit"),
+    # Check growth rate
+    (lambda f: f['growth_rate'] < 5,
+     "📈 Implement aggressive growth strategies to improve momentum"),
+    (lambda f: f['growth_rate'] > 30,
+     "🚀 Excellent growth! Ensure infrastructure scales with demand")
+)
+
+# Suggestions appended per prediction label; unknown labels get the Low ones
+_LABEL_SUGGESTIONS = {
+    "High Potential": (
+        "✨ Strong fundamentals! Focus on execution and scaling",
+        "🎯 Consider strategic partnerships to accelerate market dominance"
+    ),
+    "Moderate Potential": (
+        "📊 Solid foundation - identify key metrics to push to next level",
+        "🔍 Analyze competitors and find differentiation opportunities"
+    ),
+    "Low Potential": (
+        "🔄 Pivot consideration: Reassess product-market fit",
+        "💡 Focus on lean operations and validated learning",
+        "🤝 Seek mentorship and advisory support"
+    )
+}
+
 
 def validate_inputs(funding, team_size, market_size, revenue, growth_rate):
     """
@@ -16,42 +75,37 @@ def validate_inputs(funding, team_size, market_size, revenue, growth_rate):
         growth_rate: Monthly growth rate percentage
     
     Returns:
-        tuple: (is_valid, error_message)
+        tuple: (is_valid, error_message) describing the first failed check
     """
-    errors = []
-    
     # Validate funding
     if funding < 0:
-        errors.append("Funding cannot be negative")
+        return False, "Funding cannot be negative"
     if funding > 1e10:  # 10 billion
-        errors.append("Funding amount seems unrealistic (max: $10B)")
+        return False, "Funding amount seems unrealistic (max: $10B)"
     
     # Validate team size
     if team_size < 1:
-        errors.append("Team size must be at least 1")
+        return False, "Team size must be at least 1"
     if team_size > 10000:
-        errors.append("Team size seems unrealistic (max: 10,000)")
+        return False, "Team size seems unrealistic (max: 10,000)"
     
     # Validate market size
     if market_size < 0:
-        errors.append("Market size cannot be negative")
+        return False, "Market size cannot be negative"
     if market_size > 1e12:  # 1 trillion
-        errors.append("Market size seems unrealistic (max: $1T)")
+        return False, "Market size seems unrealistic (max: $1T)"
     
     # Validate revenue
     if revenue < 0:
-        errors.append("Revenue cannot be negative")
+        return False, "Revenue cannot be negative"
     if revenue > 1e9:  # 1 billion per month
-        errors.append("Monthly revenue seems unrealistic (max: $1B/month)")
+        return False, "Monthly revenue seems unrealistic (max: $1B/month)"
     
     # Validate growth rate
     if growth_rate < -100:
-        errors.append("Growth rate cannot be less than -100%")
+        return False, "Growth rate cannot be less than -100%"
     if growth_rate > 1000:
-        errors.append("Growth rate seems unrealistic (max: 1000%)")
-    
-    if errors:
-        return False, "; ".join(errors)
+        return False, "Growth rate seems unrealistic (max: 1000%)"
     
     return True, ""
 
@@ -67,67 +121,25 @@ def get_strategy_suggestions(prediction_label, features):
     Returns:
         list: Strategic suggestions
     """
-    suggestions = []
-    
-    # Check funding level
-    if features['funding'] < 100000:
-        suggestions.append("💰 Consider seeking additional funding to scale operations")
-    
-    # Check team size
-    if features['team_size'] < 5:
-        suggestions.append("👥 Growing your team could help accelerate development")
-    elif features['team_size'] > 50 and features['revenue'] < 50000:
-        suggestions.append("⚖️ Team size seems large relative to revenue - optimize costs")
-    
-    # Check market size
-    if features['market_size'] < 10000000:
-        suggestions.append("🎯 Consider expanding to larger markets for better growth potential")
-    
-    # Check revenue
-    if features['revenue'] < 10000:
-        suggestions.append("💵 Focus on revenue generation and finding product-market fit")
-    
-    # Check growth rate
-    if features['growth_rate'] < 5:
-        suggestions.append("📈 Implement aggressive growth strategies to improve momentum")
-    elif features['growth_rate'] > 30:
-        suggestions.append("🚀 Excellent growth! Ensure infrastructure scales with demand")
+    suggestions = [message for check, message in _SUGGESTION_RULES if check(features)]
     
     # Prediction-specific suggestions
-    if prediction_label == "High Potential":
-        suggestions.append("✨ Strong fundamentals! Focus on execution and scaling")
-        suggestions.append("🎯 Consider strategic partnerships to accelerate market dominance")
-    elif prediction_label == "Moderate Potential":
-        suggestions.append("📊 Solid foundation - identify key metrics to push to next level")
-        suggestions.append("🔍 Analyze competitors and find differentiation opportunities")
-    else:  # Low Potential
-        suggestions.append("🔄 Pivot consideration: Reassess product-market fit")
-        suggestions.append("💡 Focus on lean operations and validated learning")
-        suggestions.append("🤝 Seek mentorship and advisory support")
+    suggestions.extend(_LABEL_SUGGESTIONS.get(prediction_label, _LABEL_SUGGESTIONS["Low Potential"]))
     
     return suggestions[:5]  # Return max 5 suggestions
 
 
 def format_currency(amount):
     """Format a number as currency"""
-    if amount >= 1e9:
-        return f"${amount/1e9:.2f}B"
-    elif amount >= 1e6:
-        return f"${amount/1e6:.2f}M"
-    elif amount >= 1e3:
-        return f"${amount/1e3:.2f}K"
-    else:
-        return f"${amount:.2f}"
+    for scale, suffix in _CURRENCY_SCALES:
+        if amount >= scale:
+            return f"${amount/scale:.2f}{suffix}"
+    return f"${amount:.2f}"
 
 
 def get_success_color(prediction_label):
     """Get color code based on prediction label"""
-    colors = {
-        "High Potential": "#28a745",  # Green
-        "Moderate Potential": "#ffc107",  # Yellow
-        "Low Potential": "#dc3545"  # Red
-    }
-    return colors.get(prediction_label, "#6c757d")
+    return _SUCCESS_COLORS.get(prediction_label, "#6c757d")
 
 
 def get_score_color(score):
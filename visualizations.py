@@ -3,16 +3,282 @@ Visualization Module for Startup Success Predictor
 Provides various charts and graphs for data visualization
 """
 
+import base64
+import json
+import os
+from functools import lru_cache, wraps
+
 import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
+import plotly.io as pio
 import numpy as np
-from plotly.subplots import make_subplots
+
+from analytics import BENCHMARKS
+from utils import format_currency, njit
 
 # Constants
 PROJECTION_MONTHS = 13  # Number of months for trajectory projection (0-12)
+FIGURE_CACHE_SIZE = 256  # Figures kept per chart builder
+VALIDATE_FIGURES = os.environ.get('DEBUG') == '1'  # Run Plotly's validators on every build
+# Return plain figure dicts (for Dash or JSON consumers) instead of Figures;
+# keep this off for st.plotly_chart, which re-validates every dict it is given
+RETURN_DICT = os.environ.get('SP_RETURN_DICT') == '1'
+# Set SP_FIGURES=0 to skip chart building (headless scoring, tests); the
+# public builders then return None
+ENABLE_FIGURES = os.environ.get('SP_FIGURES', '1') == '1'
+
+# Probability chart categories, in the order of the result's probability keys
+_PROB_LEVELS = ('low', 'moderate', 'high')
+_PROB_CATEGORIES = np.array(['Low Potential', 'Moderate Potential', 'High Potential'])
+_PROB_COLORS = ('#dc3545', '#ffc107', '#28a745')
+
+# Feature order of the radar axes and of _feature_vector()
+_FEATURE_ORDER = ('funding', 'team_size', 'market_size', 'revenue', 'growth_rate')
+
+# Radar chart axes and the value each feature is capped at (shown as 100)
+_RADAR_CATEGORIES = np.array(['Funding', 'Team Size', 'Market Size', 'Revenue', 'Growth Rate'])
+# Benchmark values per radar axis (rows) and segment id (columns)
+_BENCHMARK_COLUMNS = np.stack([BENCHMARKS[name] for name in _FEATURE_ORDER])
+_RADAR_CAPS = np.array([
+    10000000,  # Cap at 10M
+    100,  # Cap at 100
+    500000000,  # Cap at 500M
+    1000000,  # Cap at 1M
+    50  # Cap at 50%
+], dtype=np.float64)
+
+# Trajectory months and the growth multipliers of the expected, optimistic
+# and conservative scenarios
+_MONTHS = np.arange(PROJECTION_MONTHS)
+_SCENARIO_FACTORS = np.array([1.0, 1.5, 0.5])
+
+# Row labels of the metrics overview table
+_OVERVIEW_METRICS = ('Funding', 'Team Size', 'Market Size', 'Monthly Revenue', 'Growth Rate',
+                     'Revenue per Member')
+
+# Currency labels recur across reruns with the same inputs
+_format_currency = lru_cache(maxsize=1024)(format_currency)
+
+# Success score bands (low below 40, moderate below 70, high from 70) with
+# the gauge color and monthly trajectory growth rate of each band
+_SCORE_EDGES = np.array([40.0, 70.0])
+_SCORE_COLORS = ('#dc3545', '#ffc107', '#28a745')
+_SCORE_GROWTH = np.array([0.03, 0.08, 0.15])
+
+
+def _key(values):
+    """
+    Build a hashable cache key from a dict of numbers
+    
+    Values are rounded to 4 decimals so reruns with the same inputs hit the
+    cache; key order is kept because it sets the order of chart categories.
+    
+    Args:
+        values: dict (or mapping) of names to numbers
+    
+    Returns:
+        tuple: ((name, rounded value), ...)
+    """
+    return tuple((name, round(value, 4)) for name, value in values.items())
+
+
+def _when_enabled(builder):
+    """Make a public chart builder return None while ENABLE_FIGURES is off"""
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        if not ENABLE_FIGURES:
+            return None
+        return builder(*args, **kwargs)
+    return wrapper
+
+
+def _as_feature_dict(values):
+    """
+    Accept feature inputs as a dict or as the first row of a dataframe
+    
+    A polars DataFrame contributes its first row read natively; other
+    dataframes exposing to_pandas() (cuDF) convert only their first row. A
+    pandas DataFrame contributes its first row and a Series is used as is.
+    
+    Args:
+        values: dict, mapping, pandas Series or one-row dataframe
+    
+    Returns:
+        dict: names to values
+    """
+    if hasattr(values, 'row') and hasattr(values, 'columns'):
+        return values.row(0, named=True)
+    if hasattr(values, 'to_pandas'):
+        # Slice before converting so the rest of the frame is never copied
+        values = values.head(1).to_pandas()
+    if hasattr(values, 'columns') and hasattr(values, 'to_dict'):
+        # Row records keep each column's own dtype (iloc[0] would upcast ints)
+        return values.head(1).to_dict('records')[0]
+    return values if isinstance(values, dict) else dict(values.items())
+
+
+def _benchmark_key(benchmark_data):
+    """Cache key for benchmark input: the segment id itself, or a _key tuple"""
+    # bool is an int subclass, so True would otherwise pass as segment 1
+    if isinstance(benchmark_data, (bool, np.bool_)):
+        raise TypeError("benchmark_data must be a benchmark dict or a segment id, not a bool")
+    if isinstance(benchmark_data, (int, np.integer)):
+        return int(benchmark_data)
+    return _key(benchmark_data)
+
+
+def _feature_vector(values):
+    """Read the five features into a float64 array in _FEATURE_ORDER"""
+    return np.fromiter(
+        (values[name] for name in _FEATURE_ORDER),
+        dtype=np.float64, count=len(_FEATURE_ORDER)
+    )
+
+
+def _score_band(success_score):
+    """Index of the success score band: 0 low, 1 moderate, 2 high"""
+    # side='right' puts scores of exactly 40 or 70 in the upper band
+    return int(np.searchsorted(_SCORE_EDGES, success_score, side='right'))
+
+
+def _figure(figure_dict):
+    """
+    Rebuild a Figure from a cached figure dict
+    
+    The dict comes from to_dict() on a figure that was validated when it was
+    built, so Plotly's validators are skipped unless DEBUG=1 is set. The
+    returned figure, its layout and its traces have validation switched back
+    on, so later update_layout, update_traces or add_trace calls are still
+    checked.
+    
+    Args:
+        figure_dict: dict returned by one of the cached chart builders
+    
+    Returns:
+        plotly figure object, or, if RETURN_DICT is set, a private copy of
+        the dict with every array as a plain list
+    """
+    if RETURN_DICT:
+        return _plain_dict(figure_dict)
+    fig = go.Figure(figure_dict, _validate=VALIDATE_FIGURES)
+    _enable_validation(fig)
+    _enable_validation(fig.layout)
+    for trace in fig.data:
+        _enable_validation(trace)
+    return fig
+
+
+def _plain_dict(value):
+    """
+    Copy a cached figure dict with its arrays decoded to plain lists
+    
+    to_dict() stores numeric arrays as plotly.js typed-array specs
+    ({'dtype', 'bdata', 'shape'}) and leaves other arrays as numpy arrays;
+    both become lists so consumers can index fig['data'][0]['x'] directly.
+    
+    Args:
+        value: figure dict, or any value nested inside one
+    
+    Returns:
+        copy of value built from dicts, lists and Python scalars
+    """
+    if isinstance(value, dict):
+        if 'bdata' in value and 'dtype' in value:
+            array = np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype'])
+            if 'shape' in value:
+                array = array.reshape([int(size) for size in value['shape'].split(',')])
+            return array.tolist()
+        return {key: _plain_dict(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain_dict(item) for item in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
+def _enable_validation(obj):
+    """Switch validation back on for a plotly object and its built children"""
+    obj._validate = True
+    # Children Plotly has not built yet are created with validation on
+    for child in getattr(obj, '_compound_props', {}).values():
+        _enable_validation(child)
+    for children in getattr(obj, '_compound_array_props', {}).values():
+        for child in children:
+            _enable_validation(child)
+
+
+def _layout(template=None, **properties):
+    """
+    Validate a static chart layout once, at import
+    
+    Args:
+        template: resolved template dict shared by reference, or None for
+            Plotly's default template
+        **properties: keyword arguments accepted by fig.update_layout
+    
+    Returns:
+        dict: normalized layout
+    """
+    layout = go.Layout(**properties).to_plotly_json()
+    if template is not None:
+        layout['template'] = template
+    return layout
+
+
+# The plotly_white template, resolved and validated once for every layout;
+# to_plotly_json() returns a copy, so the registered template is never mutated
+_PLOTLY_WHITE = pio.templates['plotly_white'].to_plotly_json()
 
 
+# Static layouts of the chart builders, passed to go.Figure unvalidated
+_PROBABILITY_LAYOUT = _layout(
+    title='Success Probability Distribution',
+    xaxis_title='Success Category',
+    yaxis_title='Probability (%)',
+    yaxis_range=[0, 100],
+    height=400,
+    showlegend=False,
+    template=_PLOTLY_WHITE
+)
+_GAUGE_LAYOUT = _layout(
+    height=400,
+    margin=dict(l=20, r=20, t=60, b=20)
+)
+_COMPARISON_LAYOUT = _layout(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 100]
+        )
+    ),
+    showlegend=True,
+    title='Metrics Comparison vs. Industry Benchmark',
+    height=500
+)
+_IMPACT_LAYOUT = _layout(
+    title='Feature Importance in Prediction',
+    xaxis_title='Importance (%)',
+    yaxis_title='Features',
+    height=400,
+    showlegend=False,
+    template=_PLOTLY_WHITE
+)
+_OVERVIEW_LAYOUT = _layout(
+    title='Metrics Overview',
+    height=320,
+    margin=dict(l=20, r=20, t=60, b=20),
+    showlegend=False
+)
+_TRAJECTORY_LAYOUT = _layout(
+    title='Projected Growth Trajectory (12 Months)',
+    xaxis_title='Months',
+    yaxis_title='Relative Growth Index',
+    height=400,
+    template=_PLOTLY_WHITE,
+    hovermode='x unified'
+)
+
+
+@_when_enabled
 def create_probability_chart(probabilities):
     """
     Create a bar chart showing probability distribution across categories
@@ -23,33 +289,33 @@ def create_probability_chart(probabilities):
     Returns:
         plotly figure object
     """
-    categories = ['Low Potential', 'Moderate Potential', 'High Potential']
-    values = [probabilities['low'], probabilities['moderate'], probabilities['high']]
-    colors = ['#dc3545', '#ffc107', '#28a745']
+    return _figure(_probability_chart(_key(probabilities)))
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _probability_chart(key):
+    """Figure dict for create_probability_chart, cached on its rounded inputs"""
+    probabilities = dict(key)
+    
+    values = np.fromiter(
+        (probabilities[level] for level in _PROB_LEVELS),
+        dtype=np.float64, count=len(_PROB_LEVELS)
+    )
     
     fig = go.Figure(data=[
         go.Bar(
-            x=categories,
+            x=_PROB_CATEGORIES,
             y=values,
-            marker_color=colors,
-            text=[f'{v:.1f}%' for v in values],
+            marker_color=_PROB_COLORS,
+            text=np.char.mod('%.1f%%', values),
             textposition='auto',
         )
-    ])
-    
-    fig.update_layout(
-        title='Success Probability Distribution',
-        xaxis_title='Success Category',
-        yaxis_title='Probability (%)',
-        yaxis_range=[0, 100],
-        height=400,
-        showlegend=False,
-        template='plotly_white'
-    )
+    ], layout=_PROBABILITY_LAYOUT, _validate=VALIDATE_FIGURES)
     
-    return fig
+    return fig.to_dict()
 
 
+@_when_enabled
 def create_success_gauge(success_score):
     """
     Create a gauge chart showing the success score
@@ -60,13 +326,14 @@ def create_success_gauge(success_score):
     Returns:
         plotly figure object
     """
+    return _figure(_success_gauge(round(success_score, 4)))
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _success_gauge(success_score):
+    """Figure dict for create_success_gauge, cached on its rounded inputs"""
     # Determine color based on score
-    if success_score >= 70:
-        color = '#28a745'
-    elif success_score >= 40:
-        color = '#ffc107'
-    else:
-        color = '#dc3545'
+    color = _SCORE_COLORS[_score_band(success_score)]
     
     fig = go.Figure(go.Indicator(
         mode="gauge+number+delta",
@@ -91,200 +358,160 @@ def create_success_gauge(success_score):
                 'value': 90
             }
         }
-    ))
-    
-    fig.update_layout(
-        height=400,
-        margin=dict(l=20, r=20, t=60, b=20)
-    )
+    ), layout=_GAUGE_LAYOUT, _validate=VALIDATE_FIGURES)
     
-    return fig
+    return fig.to_dict()
 
 
+@_when_enabled
 def create_feature_comparison_chart(features, benchmark_data):
     """
     Create a radar chart comparing user's metrics with benchmarks
     
     Args:
-        features: dict with startup features
-        benchmark_data: dict with benchmark values for each category
+        features: dict (or one-row dataframe) with startup features
+        benchmark_data: dict with benchmark values for each category, or a
+            segment id from analytics.get_benchmark_segment
     
     Returns:
         plotly figure object
     """
-    categories = ['Funding', 'Team Size', 'Market Size', 'Revenue', 'Growth Rate']
+    return _figure(_feature_comparison_chart(_key(_as_feature_dict(features)), _benchmark_key(benchmark_data)))
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _feature_comparison_chart(features_key, benchmark_key):
+    """Figure dict for create_feature_comparison_chart, cached on its rounded inputs"""
+    features = dict(features_key)
     
     # Normalize features to 0-100 scale for comparison
-    user_values = [
-        min(features['funding'] / 10000000 * 100, 100),  # Cap at 10M
-        min(features['team_size'] / 100 * 100, 100),  # Cap at 100
-        min(features['market_size'] / 500000000 * 100, 100),  # Cap at 500M
-        min(features['revenue'] / 1000000 * 100, 100),  # Cap at 1M
-        min(features['growth_rate'] / 50 * 100, 100)  # Cap at 50%
-    ]
-    
-    # Get benchmark values
-    benchmark_values = [
-        benchmark_data['funding'],
-        benchmark_data['team_size'],
-        benchmark_data['market_size'],
-        benchmark_data['revenue'],
-        benchmark_data['growth_rate']
-    ]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=user_values,
-        theta=categories,
-        fill='toself',
-        name='Your Startup',
-        line_color='#4CAF50'
-    ))
+    user_values = np.minimum(_feature_vector(features) / _RADAR_CAPS * 100.0, 100.0)
     
-    fig.add_trace(go.Scatterpolar(
-        r=benchmark_values,
-        theta=categories,
-        fill='toself',
-        name='Industry Benchmark',
-        line_color='#2196F3'
-    ))
+    # Get benchmark values: one column of the SoA table for a segment id
+    if isinstance(benchmark_key, int):
+        benchmark_values = _BENCHMARK_COLUMNS[:, benchmark_key]
+    else:
+        benchmark_values = _feature_vector(dict(benchmark_key))
     
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100]
-            )
+    fig = go.Figure(data=[
+        go.Scatterpolar(
+            r=user_values,
+            theta=_RADAR_CATEGORIES,
+            fill='toself',
+            name='Your Startup',
+            line_color='#4CAF50'
         ),
-        showlegend=True,
-        title='Metrics Comparison vs. Industry Benchmark',
-        height=500
-    )
+        go.Scatterpolar(
+            r=benchmark_values,
+            theta=_RADAR_CATEGORIES,
+            fill='toself',
+            name='Industry Benchmark',
+            line_color='#2196F3'
+        )
+    ], layout=_COMPARISON_LAYOUT, _validate=VALIDATE_FIGURES)
     
-    return fig
+    return fig.to_dict()
 
 
+@_when_enabled
 def create_feature_impact_chart(feature_importance):
     """
     Create a horizontal bar chart showing feature importance
     
     Args:
-        feature_importance: dict with feature names and importance scores
+        feature_importance: dict (or one-row dataframe) with feature names and importance scores
     
     Returns:
         plotly figure object
     """
-    features = list(feature_importance.keys())
-    importance = list(feature_importance.values())
+    return _figure(_feature_impact_chart(_key(_as_feature_dict(feature_importance))))
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _feature_impact_chart(key):
+    """Figure dict for create_feature_impact_chart, cached on its rounded inputs"""
+    feature_importance = dict(key)
+    
+    features = np.array(list(feature_importance.keys()))
+    importance = np.fromiter(feature_importance.values(), dtype=np.float64, count=len(feature_importance))
     
     fig = go.Figure(go.Bar(
         x=importance,
         y=features,
         orientation='h',
         marker_color='#4CAF50',
-        text=[f'{v:.1f}%' for v in importance],
+        text=np.char.mod('%.1f%%', importance),
         textposition='auto',
-    ))
-    
-    fig.update_layout(
-        title='Feature Importance in Prediction',
-        xaxis_title='Importance (%)',
-        yaxis_title='Features',
-        height=400,
-        showlegend=False,
-        template='plotly_white'
-    )
+    ), layout=_IMPACT_LAYOUT, _validate=VALIDATE_FIGURES)
     
-    return fig
+    return fig.to_dict()
 
 
+@_when_enabled
 def create_metrics_overview(features):
     """
-    Create a multi-chart overview of all metrics
+    Create a table overview of all metrics
     
     Args:
-        features: dict with startup features
+        features: dict (or one-row dataframe) with startup features
     
     Returns:
-        plotly figure object with subplots
+        plotly figure object with a single table trace
     """
-    fig = make_subplots(
-        rows=2, cols=3,
-        subplot_titles=('Funding', 'Team Size', 'Market Size', 
-                       'Monthly Revenue', 'Growth Rate', 'Summary'),
-        specs=[[{'type': 'indicator'}, {'type': 'indicator'}, {'type': 'indicator'}],
-               [{'type': 'indicator'}, {'type': 'indicator'}, {'type': 'table'}]]
+    return _figure(_metrics_overview(_key(_as_feature_dict(features))))
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _metrics_overview(key):
+    """Figure dict for create_metrics_overview, cached on its rounded inputs"""
+    features = dict(key)
+    
+    # Derived summary row: monthly revenue per team member
+    team_size = features['team_size']
+    revenue_per_member = _format_currency(features['revenue'] / team_size) if team_size > 0 else "N/A"
+    
+    values = (
+        _format_currency(features['funding']),
+        f"{features['team_size']} members",
+        _format_currency(features['market_size']),
+        _format_currency(features['revenue']),
+        f"{features['growth_rate']}%",
+        revenue_per_member
     )
     
-    # Format currency for display
-    def format_currency(amount):
-        if amount >= 1e9:
-            return f"${amount/1e9:.2f}B"
-        elif amount >= 1e6:
-            return f"${amount/1e6:.2f}M"
-        elif amount >= 1e3:
-            return f"${amount/1e3:.2f}K"
-        else:
-            return f"${amount:.2f}"
-    
-    # Add indicators
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=features['funding'],
-        title={'text': "Funding"},
-        number={'prefix': "$", 'valueformat': ",.0f"},
-    ), row=1, col=1)
-    
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=features['team_size'],
-        title={'text': "Team Size"},
-    ), row=1, col=2)
-    
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=features['market_size'],
-        title={'text': "Market Size"},
-        number={'prefix': "$", 'valueformat': ",.0f"},
-    ), row=1, col=3)
-    
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=features['revenue'],
-        title={'text': "Monthly Revenue"},
-        number={'prefix': "$", 'valueformat': ",.0f"},
-    ), row=2, col=1)
-    
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=features['growth_rate'],
-        title={'text': "Growth Rate"},
-        number={'suffix': "%"},
-    ), row=2, col=2)
-    
-    # Add summary table
-    fig.add_trace(go.Table(
+    # The table's shape never changes, so only the value cells are filled in;
+    # each is JSON-escaped without its surrounding quotes
+    return json.loads(_metrics_overview_template().format(
+        *(json.dumps(value)[1:-1] for value in values)
+    ))
+
+
+@lru_cache(maxsize=None)
+def _metrics_overview_template():
+    """
+    Serialize the metrics overview once with a str.format slot per value cell
+    
+    Returns:
+        str: figure JSON with braces escaped and slots {0}..{5} in the value column
+    """
+    slots = tuple(f'__value_{i}__' for i in range(len(_OVERVIEW_METRICS)))
+    
+    fig = go.Figure(data=[go.Table(
         header=dict(values=['Metric', 'Value'],
                    fill_color='paleturquoise',
                    align='left'),
-        cells=dict(values=[
-            ['Funding', 'Team', 'Market', 'Revenue', 'Growth'],
-            [format_currency(features['funding']),
-             f"{features['team_size']} members",
-             format_currency(features['market_size']),
-             format_currency(features['revenue']),
-             f"{features['growth_rate']}%"]
-        ],
+        cells=dict(values=[_OVERVIEW_METRICS, slots],
         fill_color='lavender',
         align='left')
-    ), row=2, col=3)
-    
-    fig.update_layout(height=600, showlegend=False)
+    )], layout=_OVERVIEW_LAYOUT, _validate=VALIDATE_FIGURES)
     
-    return fig
+    template = pio.to_json(fig, validate=False).replace('{', '{{').replace('}', '}}')
+    for i, slot in enumerate(slots):
+        template = template.replace(slot, f'{{{i}}}')
+    return template
 
 
+@_when_enabled
 def create_success_trajectory_chart(success_score):
     """
     Create a visualization showing potential growth trajectory
@@ -295,53 +522,59 @@ def create_success_trajectory_chart(success_score):
     Returns:
         plotly figure object
     """
-    months = list(range(0, PROJECTION_MONTHS))
-    
+    return _figure(_success_trajectory_chart(round(success_score, 4)))
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _success_trajectory_chart(success_score):
+    """Figure dict for create_success_trajectory_chart, cached on its rounded inputs"""
     # Generate trajectories based on success score
-    if success_score >= 70:
-        growth_rate = 0.15  # 15% monthly growth for high potential
-    elif success_score >= 40:
-        growth_rate = 0.08  # 8% monthly growth for moderate
-    else:
-        growth_rate = 0.03  # 3% monthly growth for low potential
-    
-    base_value = 100
-    trajectory = [base_value * ((1 + growth_rate) ** month) for month in months]
+    growth_rate = float(_SCORE_GROWTH[_score_band(success_score)])
     
-    # Also show alternative scenarios
-    optimistic = [base_value * ((1 + growth_rate * 1.5) ** month) for month in months]
-    conservative = [base_value * ((1 + growth_rate * 0.5) ** month) for month in months]
+    trajectory, optimistic, conservative = _trajectories(growth_rate)
     
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=months, y=trajectory,
-        mode='lines+markers',
-        name='Expected Growth',
-        line=dict(color='#4CAF50', width=3)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=months, y=optimistic,
-        mode='lines',
-        name='Optimistic Scenario',
-        line=dict(color='#81C784', width=2, dash='dash')
-    ))
+    fig = go.Figure(data=[
+        go.Scatter(
+            x=_MONTHS, y=trajectory,
+            mode='lines+markers',
+            name='Expected Growth',
+            line=dict(color='#4CAF50', width=3)
+        ),
+        go.Scatter(
+            x=_MONTHS, y=optimistic,
+            mode='lines',
+            name='Optimistic Scenario',
+            line=dict(color='#81C784', width=2, dash='dash')
+        ),
+        go.Scatter(
+            x=_MONTHS, y=conservative,
+            mode='lines',
+            name='Conservative Scenario',
+            line=dict(color='#FFB74D', width=2, dash='dash')
+        )
+    ], layout=_TRAJECTORY_LAYOUT, _validate=VALIDATE_FIGURES)
     
-    fig.add_trace(go.Scatter(
-        x=months, y=conservative,
-        mode='lines',
-        name='Conservative Scenario',
-        line=dict(color='#FFB74D', width=2, dash='dash')
-    ))
+    return fig.to_dict()
+
+
+@njit('float64[:, ::1](float64)', cache=True)
+def _trajectories(growth_rate):
+    """
+    Compound a base index of 100 over the projection months
     
-    fig.update_layout(
-        title='Projected Growth Trajectory (12 Months)',
-        xaxis_title='Months',
-        yaxis_title='Relative Growth Index',
-        height=400,
-        template='plotly_white',
-        hovermode='x unified'
-    )
+    Args:
+        growth_rate: expected monthly growth rate (0.08 for 8%)
     
-    return fig
+    Returns:
+        ndarray: (3, PROJECTION_MONTHS) expected, optimistic and conservative rows
+    """
+    out = np.empty((3, PROJECTION_MONTHS))
+    for scenario in range(3):
+        factor = 1.0 + growth_rate * _SCENARIO_FACTORS[scenario]
+        value = 100.0
+        out[scenario, 0] = value
+        for month in range(1, PROJECTION_MONTHS):
+            value *= factor
+            out[scenario, month] = value
+    return out
+